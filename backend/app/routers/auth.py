@@ -3,14 +3,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks
 from fastapi.responses import RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError, jwt
 from authlib.integrations.starlette_client import OAuthError
 import secrets
 from urllib.parse import urlencode
 from datetime import datetime, timedelta
 
 # --- MODIFIED: Added email_utils import ---
-from .. import crud, models, schemas, security, email_utils
+from .. import crud, models, schemas, security, email_utils, tokens
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -116,11 +115,11 @@ async def login_for_access_token(request: Request, form_data: OAuth2PasswordRequ
 async def refresh_access_token(body: schemas.RefreshTokenRequest):
     refresh_token = body.refresh_token
     try:
-        payload = jwt.decode(refresh_token, security.settings.JWT_SECRET_KEY, algorithms=[security.ALGORITHM])
+        payload = security.decode_token(refresh_token)
         email: str = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=401, detail="Invalid refresh token")
-    except JWTError:
+    except tokens.TokenError:
         raise HTTPException(status_code=401, detail="Invalid refresh token")
 
     user = await crud.get_user_by_email(email=email)
@@ -133,11 +132,11 @@ async def refresh_access_token(body: schemas.RefreshTokenRequest):
 @router.post("/verify-email")
 async def verify_email(token: str):
     try:
-        payload = jwt.decode(token, security.settings.JWT_SECRET_KEY, algorithms=[security.ALGORITHM])
+        payload = security.decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=400, detail="Invalid token")
-    except JWTError:
+    except tokens.TokenError:
         raise HTTPException(status_code=400, detail="Invalid token")
     
     user = await crud.get_user_by_email(email=email)
@@ -182,11 +181,11 @@ async def forgot_password(email: str, background_tasks: BackgroundTasks):
 @router.post("/reset-password")
 async def reset_password(token: str, new_password: str):
     try:
-        payload = jwt.decode(token, security.settings.JWT_SECRET_KEY, algorithms=[security.ALGORITHM])
+        payload = security.decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=400, detail="Invalid token")
-    except JWTError:
+    except tokens.TokenError:
         raise HTTPException(status_code=400, detail="Invalid or expired token")
         
     user = await crud.get_user_by_email(email=email)
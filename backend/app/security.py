@@ -1,5 +1,5 @@
 from passlib.context import CryptContext
-from jose import jwt, JWTError
+from typing import Dict, Optional
 from datetime import datetime, timedelta, timezone
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -7,12 +7,20 @@ from pydantic_settings import BaseSettings
 from authlib.integrations.starlette_client import OAuth
 from pathlib import Path
 from .models import User as UserModel
+from .tokens import TokenCodec, TokenError
 
 # Robust .env resolution
 env_path = Path(__file__).parent.parent / ".env"
 
 class Settings(BaseSettings):
     JWT_SECRET_KEY: str
+    # Key ID stamped on issued tokens. To rotate, move the old secret into
+    # JWT_PREVIOUS_KEYS (JSON, e.g. {"2024-01": "old-secret"}) under its key ID.
+    # Tokens issued before JWT_KEY_ID was set have no key ID; if the secret they
+    # were signed with is rotated out, put it in JWT_LEGACY_KEY.
+    JWT_KEY_ID: Optional[str] = None
+    JWT_PREVIOUS_KEYS: Dict[str, str] = {}
+    JWT_LEGACY_KEY: Optional[str] = None
     MONGO_URI: str
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
@@ -43,13 +51,22 @@ REFRESH_TOKEN_EXPIRE_DAYS = 7
 # --- NEW ---
 VERIFICATION_TOKEN_EXPIRE_MINUTES = 15 # Token for email/password reset is valid for 15 mins
 # --- END NEW ---
-ALGORITHM = "HS256"
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
+token_codec = TokenCodec(
+    settings.JWT_SECRET_KEY,
+    key_id=settings.JWT_KEY_ID,
+    previous_keys=settings.JWT_PREVIOUS_KEYS,
+    legacy_key=settings.JWT_LEGACY_KEY,
+)
 
 def create_token(data: dict, expires_delta: timedelta):
     to_encode = data.copy()
     to_encode.update({"exp": datetime.now(timezone.utc) + expires_delta})
-    return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=ALGORITHM)
+    return token_codec.encode(to_encode)
+
+def decode_token(token: str) -> dict:
+    """Verifies a token issued by `create_token` and returns its claims. Raises TokenError if invalid."""
+    return token_codec.decode(token)
 
 def create_access_token(data: dict):  return create_token(data, timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
 def create_refresh_token(data: dict): return create_token(data, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
@@ -68,11 +85,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserModel:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         email: str = payload.get("sub")
         if not email:
             raise cred_exc
-    except JWTError:
+    except TokenError:
         raise cred_exc
     
     user = await crud.get_user_by_email(email=email)
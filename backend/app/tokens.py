@@ -0,0 +1,139 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from calendar import timegm
+from datetime import datetime
+from typing import Dict, Optional
+
+class TokenError(Exception):
+    """Raised when a token is malformed, has a bad signature or fails a claim check."""
+
+class ExpiredTokenError(TokenError):
+    """Raised when a token's `exp` claim is in the past."""
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _json(data: dict) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+class TokenCodec:
+    """
+    Issues and verifies HS256 JWTs with all per-key work done up front.
+
+    - The HMAC key is prepared once per key; each call only copies that state.
+    - The encoded header for the signing key is cached, so issuing a token only
+      serializes the claims.
+    - Signatures are compared in constant time against the encoded digest.
+    - When `key_id` is set, tokens carry a `kid` header. Tokens signed with any
+      key in `previous_keys` still verify, so the secret can be rotated without
+      logging everyone out.
+    - Tokens without a `kid` (issued before a `key_id` was configured) are checked
+      against `legacy_key`, or against the current secret if it is not set.
+    """
+
+    ALGORITHM = "HS256"
+
+    def __init__(
+        self,
+        secret_key: str,
+        key_id: Optional[str] = None,
+        previous_keys: Optional[Dict[str, str]] = None,
+        legacy_key: Optional[str] = None,
+    ):
+        if legacy_key is not None and key_id is None:
+            # Without a key ID, new tokens are kid-less too and could not be told apart from legacy ones.
+            raise ValueError("A key_id is required when a legacy_key is configured")
+        self._signing_hmac = self._prepare(secret_key)
+        self._hmacs = {kid: self._prepare(key) for kid, key in (previous_keys or {}).items()}
+        if key_id is not None:
+            self._hmacs[key_id] = self._signing_hmac
+        self._legacy_hmac = self._prepare(legacy_key) if legacy_key is not None else self._signing_hmac
+
+        header = {"alg": self.ALGORITHM, "typ": "JWT"}
+        if key_id is not None:
+            header["kid"] = key_id
+        self._header_segment = _b64encode(_json(header))
+        # Header segments we issue are matched verbatim, skipping the JSON parse.
+        self._known_headers = {self._header_segment: self._signing_hmac}
+
+    @staticmethod
+    def _prepare(key: str):
+        return hmac.new(key.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def _sign(self, mac, signing_input: bytes) -> str:
+        mac = mac.copy()
+        mac.update(signing_input)
+        return _b64encode(mac.digest())
+
+    def encode(self, claims: dict) -> str:
+        """Encodes `claims` into a signed token. Datetime `exp`/`iat`/`nbf` values become timestamps."""
+        payload = dict(claims)
+        for claim in ("exp", "iat", "nbf"):
+            value = payload.get(claim)
+            if isinstance(value, datetime):
+                payload[claim] = timegm(value.utctimetuple())
+        signing_input = f"{self._header_segment}.{_b64encode(_json(payload))}"
+        return f"{signing_input}.{self._sign(self._signing_hmac, signing_input.encode('ascii'))}"
+
+    def _hmac_for_header(self, header_segment: str):
+        mac = self._known_headers.get(header_segment)
+        if mac is not None:
+            return mac
+        try:
+            header = json.loads(_b64decode(header_segment))
+        except (ValueError, binascii.Error):
+            raise TokenError("Invalid header")
+        if not isinstance(header, dict) or header.get("alg") != self.ALGORITHM:
+            raise TokenError("Unsupported algorithm")
+        if "kid" not in header:
+            return self._legacy_hmac
+        kid = header["kid"]
+        if not isinstance(kid, str) or kid not in self._hmacs:
+            raise TokenError("Unknown key ID")
+        return self._hmacs[kid]
+
+    def decode(self, token: str) -> dict:
+        """Verifies `token` and returns its claims. Raises TokenError on any failure."""
+        if not isinstance(token, str):
+            raise TokenError("Malformed token")
+        signing_input, _, signature = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        try:
+            signing_bytes = signing_input.encode("ascii")
+        except UnicodeEncodeError:
+            raise TokenError("Malformed token")
+        if not header_segment or not payload_segment or "." in payload_segment or not signature.isascii():
+            raise TokenError("Malformed token")
+
+        mac = self._hmac_for_header(header_segment)
+        if not hmac.compare_digest(self._sign(mac, signing_bytes), signature):
+            raise TokenError("Signature verification failed")
+
+        try:
+            claims = json.loads(_b64decode(payload_segment))
+        except (ValueError, binascii.Error):
+            raise TokenError("Invalid payload")
+        if not isinstance(claims, dict):
+            raise TokenError("Invalid payload")
+
+        now = time.time()
+        exp = claims.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+                raise TokenError("Invalid exp claim")
+            if exp <= now:
+                raise ExpiredTokenError("Token has expired")
+        nbf = claims.get("nbf")
+        if nbf is not None:
+            if not isinstance(nbf, (int, float)) or isinstance(nbf, bool):
+                raise TokenError("Invalid nbf claim")
+            if nbf > now:
+                raise TokenError("Token is not yet valid")
+        return claims
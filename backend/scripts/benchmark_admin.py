@@ -0,0 +1,146 @@
+# backend/scripts/benchmark_admin.py
+
+"""
+Times the admin queries against a (synthetic) dataset and records their query plans.
+
+Load data first with `generate_data.py`, then run from the project root, e.g.:
+
+    python -m backend.scripts.benchmark_admin --output admin_bench.json
+
+The application settings (.env) must be present, since the admin router and
+crud module are imported exactly as the API uses them.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import motor.motor_asyncio
+from beanie import init_beanie
+
+from ..app import crud
+from ..app.models import User, LoginHistory
+from ..app.routers import admin
+from .generate_data import DEFAULT_MONGO_URI
+
+async def time_call(func, repeat: int) -> dict:
+    """Awaits `func()` `repeat` times and returns timing statistics in milliseconds."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await func()
+        timings.append((time.perf_counter() - started) * 1000)
+    returned = len(result) if isinstance(result, list) else int(result is not None)
+    return {
+        "repeat": repeat,
+        "returned": returned,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "max_ms": round(max(timings), 3),
+    }
+
+def plan_stages(plan: dict) -> list:
+    """Flattens a winning plan into its stage names, outermost first (e.g. LIMIT > SORT > COLLSCAN)."""
+    stages = []
+    while plan:
+        stage = plan.get("stage")
+        if plan.get("indexName"):
+            stage = f"{stage}({plan['indexName']})"
+        stages.append(stage)
+        plan = plan.get("inputStage") or (plan.get("inputStages") or [None])[0]
+    return stages
+
+async def explain(cursor) -> dict:
+    """Runs explain on a Motor cursor and keeps the fields useful for spotting regressions."""
+    result = await cursor.explain()
+    winning_plan = result.get("queryPlanner", {}).get("winningPlan", {})
+    # Newer servers nest the classic plan under "queryPlan" when the SBE engine is used.
+    winning_plan = winning_plan.get("queryPlan", winning_plan)
+    stats = result.get("executionStats", {})
+    return {
+        "stages": plan_stages(winning_plan),
+        "n_returned": stats.get("nReturned"),
+        "total_keys_examined": stats.get("totalKeysExamined"),
+        "total_docs_examined": stats.get("totalDocsExamined"),
+        "execution_time_ms": stats.get("executionTimeMillis"),
+    }
+
+async def run(args: argparse.Namespace) -> dict:
+    client = motor.motor_asyncio.AsyncIOMotorClient(args.mongo_uri)
+    database = client.get_default_database()
+    await init_beanie(database=database, document_models=[User, LoginHistory])
+    users_collection = database[User.Settings.name]
+    history_collection = database[LoginHistory.Settings.name]
+
+    report = {
+        "users": await users_collection.estimated_document_count(),
+        "login_history": await history_collection.estimated_document_count(),
+        "queries": [],
+    }
+    print(f"Dataset: {report['users']} users, {report['login_history']} login records")
+
+    async def record(name: str, func, cursor, repeat: int):
+        entry = {"name": name, **await time_call(func, repeat), "plan": await explain(cursor)}
+        report["queries"].append(entry)
+        print(
+            f"{name:<40} median {entry['median_ms']:>10.3f} ms  "
+            f"docs examined {entry['plan']['total_docs_examined']}  "
+            f"plan {' > '.join(entry['plan']['stages'])}"
+        )
+
+    if not args.skip_all_users:
+        await record(
+            "get_all_users",
+            admin.get_all_users,
+            users_collection.find({}),
+            args.all_users_repeat,
+        )
+
+    for skip in args.skips:
+        await record(
+            f"get_login_history(skip={skip}, limit={args.limit})",
+            lambda skip=skip: admin.get_login_history(skip=skip, limit=args.limit),
+            history_collection.find({}).sort("timestamp", -1).skip(skip).limit(args.limit),
+            args.repeat,
+        )
+
+    sample = await users_collection.aggregate(
+        [{"$sample": {"size": args.repeat}}, {"$project": {"email": 1}}]
+    ).to_list(length=args.repeat)
+    emails = [document["email"] for document in sample]
+    if emails:
+        email_iter = iter(emails)
+        await record(
+            "get_user_by_email",
+            lambda: crud.get_user_by_email(next(email_iter)),
+            users_collection.find({"email": emails[0]}).limit(1),
+            len(emails),
+        )
+
+    return report
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the admin queries and record their query plans.")
+    parser.add_argument("--mongo-uri", default=DEFAULT_MONGO_URI, help="MongoDB URI including the database name.")
+    parser.add_argument("--skips", type=int, nargs="+", default=[0, 1_000, 100_000, 1_000_000],
+                        help="Pagination depths to benchmark for the login history.")
+    parser.add_argument("--limit", type=int, default=25, help="Page size for the login history.")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per login history depth and email lookups.")
+    parser.add_argument("--all-users-repeat", type=int, default=3, help="Runs of get_all_users.")
+    parser.add_argument("--skip-all-users", action="store_true", help="Do not run get_all_users (very slow at scale).")
+    parser.add_argument("--output", help="Write the full report, including query plans, to this JSON file.")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# backend/scripts/benchmark_tokens.py
+
+"""
+Micro-benchmark of token issue and verify: TokenCodec against python-jose.
+
+Run from the project root, e.g.:
+
+    python -m backend.scripts.benchmark_tokens --number 50000
+"""
+
+import argparse
+import secrets
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from jose import jwt
+
+from ..app.tokens import TokenCodec
+
+def claims() -> dict:
+    """The same claims `security.create_access_token` issues."""
+    return {"sub": "user@example.com", "exp": datetime.now(timezone.utc) + timedelta(minutes=30)}
+
+def tokens_per_second(func, number: int, repeat: int) -> float:
+    """Returns the best throughput of `func` over `repeat` runs of `number` calls."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare token issue/verify throughput of TokenCodec and python-jose.")
+    parser.add_argument("--number", type=int, default=20_000, help="Calls per timed run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case; the best is reported.")
+    args = parser.parse_args()
+
+    secret_key = secrets.token_urlsafe(32)
+    codec = TokenCodec(secret_key, key_id="bench")
+    data = claims()
+    jose_token = jwt.encode(data, secret_key, algorithm=TokenCodec.ALGORITHM)
+    codec_token = codec.encode(data)
+    assert jwt.decode(codec_token, secret_key, algorithms=[TokenCodec.ALGORITHM])["sub"] == data["sub"]
+    assert codec.decode(jose_token)["sub"] == data["sub"]
+
+    cases = [
+        ("issue", "python-jose", lambda: jwt.encode(data, secret_key, algorithm=TokenCodec.ALGORITHM)),
+        ("issue", "TokenCodec", lambda: codec.encode(data)),
+        ("verify", "python-jose", lambda: jwt.decode(jose_token, secret_key, algorithms=[TokenCodec.ALGORITHM])),
+        ("verify", "TokenCodec", lambda: codec.decode(codec_token)),
+    ]
+    results = {}
+    for operation, implementation, func in cases:
+        results[operation, implementation] = tokens_per_second(func, args.number, args.repeat)
+        print(f"{operation:<8}{implementation:<14}{results[operation, implementation]:>14,.0f} tokens/s")
+
+    for operation in ("issue", "verify"):
+        speedup = results[operation, "TokenCodec"] / results[operation, "python-jose"]
+        print(f"{operation} speedup: {speedup:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# backend/scripts/generate_data.py
+
+"""
+Bulk-loads synthetic User and LoginHistory documents into a local MongoDB.
+
+The data is shaped to look like a real deployment rather than a uniform grid:
+- Logins per user follow a heavy-tailed (Pareto) distribution, so a few users
+  own a large share of the login history.
+- Users are split between password and social (Google / GitHub) accounts.
+- Each user gets one to three home IP addresses and one user agent. Most of a
+  user's logins come from their home IPs, the rest from random addresses.
+  Home IPs are picked with a Lomax-distributed popularity rank, so a few
+  hundred addresses (carrier NATs, offices) are shared by many users while no
+  single address holds more than a fraction of a percent of them.
+
+Run from the project root, e.g.:
+
+    python -m backend.scripts.generate_data --users 1000000 --drop
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+import motor.motor_asyncio
+from beanie import init_beanie
+from passlib.context import CryptContext
+
+from ..app.models import User, LoginHistory, UserRole
+
+DEFAULT_MONGO_URI = "mongodb://localhost:27017/auth_benchmark"
+
+# Share of users by how they signed up. Social users have no password hash.
+PROVIDER_WEIGHTS = {"password": 0.6, "google": 0.3, "github": 0.1}
+
+# Tail index of the per-user login counts; lower values concentrate more logins on fewer users.
+LOGIN_TAIL_ALPHA = 2.5
+
+# Tail index and scale (as a fraction of the pool) of the home IP popularity rank.
+IP_POPULARITY_ALPHA = 1.5
+IP_POPULARITY_SCALE = 0.01
+# Share of a user's logins made from one of their home IPs.
+HOME_IP_SHARE = 0.9
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:127.0) Gecko/20100101 Firefox/127.0",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
+    "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Mobile Safari/537.36",
+]
+
+def build_ip_pool(size: int, rng: random.Random) -> list:
+    """Creates a pool of random IPv4 addresses to draw login IPs from."""
+    return [
+        f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+        for _ in range(size)
+    ]
+
+def pick_home_ips(pool: list, rng: random.Random) -> list:
+    """Picks one to three home IPs for a user, favouring popular (low-rank) addresses."""
+    # A Lomax rank scaled to 1% of the pool spreads popularity over many entries:
+    # each of the first addresses gets well under 1% of users.
+    scale = max(len(pool) * IP_POPULARITY_SCALE, 1)
+    return [
+        pool[int((rng.paretovariate(IP_POPULARITY_ALPHA) - 1) * scale) % len(pool)]
+        for _ in range(rng.randint(1, 3))
+    ]
+
+def pick_login_ip(home_ips: list, pool: list, rng: random.Random) -> str:
+    """Picks the IP for one login: usually a home IP, otherwise any address."""
+    if rng.random() < HOME_IP_SHARE:
+        return rng.choice(home_ips)
+    return pool[rng.randrange(len(pool))]
+
+def login_count(rng: random.Random, mean: float, cap: int) -> int:
+    """Draws a heavy-tailed number of logins for one user."""
+    # paretovariate(alpha) - 1 is a Lomax variate starting at 0 with mean
+    # 1 / (alpha - 1), so scaling by mean * (alpha - 1) gives the requested mean.
+    value = (rng.paretovariate(LOGIN_TAIL_ALPHA) - 1) * mean * (LOGIN_TAIL_ALPHA - 1)
+    # Round up with probability equal to the fractional part, so the mean survives
+    # the conversion to an integer and low counts (including 0) still occur.
+    count = int(value)
+    if rng.random() < value - count:
+        count += 1
+    return min(count, cap)
+
+def make_user(index: int, provider: str, password_hash: str, rng: random.Random) -> dict:
+    """Builds a raw users document matching the User model."""
+    return {
+        "email": f"user{index}@example.com",
+        "full_name": f"User {index}",
+        "hashed_password": password_hash if provider == "password" else None,
+        "refresh_token": None,
+        "role": UserRole.ADMIN.value if rng.random() < 0.001 else UserRole.USER.value,
+        "is_verified": provider != "password" or rng.random() < 0.9,
+        "verification_token": None,
+    }
+
+def make_login(email: str, provider: str, timestamp: datetime, ip_address: str, user_agent: str) -> dict:
+    """Builds a raw login_history document matching the LoginHistory model."""
+    return {
+        "user_email": email,
+        "timestamp": timestamp,
+        "login_type": provider,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+    }
+
+async def insert_in_batches(collection, documents, batch_size: int) -> int:
+    """Inserts documents from an iterable using unordered insert_many batches."""
+    batch = []
+    total = 0
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            await collection.insert_many(batch, ordered=False)
+            total += len(batch)
+            batch = []
+    if batch:
+        await collection.insert_many(batch, ordered=False)
+        total += len(batch)
+    return total
+
+async def generate(args: argparse.Namespace):
+    rng = random.Random(args.seed)
+    client = motor.motor_asyncio.AsyncIOMotorClient(args.mongo_uri)
+    database = client.get_default_database()
+
+    if args.drop:
+        await database.drop_collection(User.Settings.name)
+        await database.drop_collection(LoginHistory.Settings.name)
+
+    # Let Beanie create the same indexes the application relies on before loading data.
+    await init_beanie(database=database, document_models=[User, LoginHistory])
+    users_collection = database[User.Settings.name]
+    history_collection = database[LoginHistory.Settings.name]
+
+    # Hashing a password per user would dominate the run time, so every
+    # password user shares one real bcrypt hash of the same password.
+    password_hash = CryptContext(schemes=["bcrypt"]).hash(args.password)
+    providers = list(PROVIDER_WEIGHTS)
+    weights = list(PROVIDER_WEIGHTS.values())
+    ip_pool = build_ip_pool(args.ip_pool, rng)
+    now = datetime.utcnow()
+    window_seconds = int(timedelta(days=args.days).total_seconds())
+
+    user_providers = rng.choices(providers, weights=weights, k=args.users)
+
+    def users():
+        for index in range(args.users):
+            yield make_user(args.offset + index, user_providers[index], password_hash, rng)
+
+    def logins():
+        for index in range(args.users):
+            email = f"user{args.offset + index}@example.com"
+            provider = user_providers[index]
+            home_ips = pick_home_ips(ip_pool, rng)
+            user_agent = rng.choice(USER_AGENTS)
+            for _ in range(login_count(rng, args.mean_logins, args.max_logins)):
+                timestamp = now - timedelta(seconds=rng.randrange(window_seconds))
+                yield make_login(email, provider, timestamp, pick_login_ip(home_ips, ip_pool, rng), user_agent)
+
+    started = time.perf_counter()
+    inserted_users = await insert_in_batches(users_collection, users(), args.batch_size)
+    print(f"Inserted {inserted_users} users in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    inserted_logins = await insert_in_batches(history_collection, logins(), args.batch_size)
+    print(f"Inserted {inserted_logins} login records in {time.perf_counter() - started:.1f}s")
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load synthetic users and login history into MongoDB.")
+    parser.add_argument("--mongo-uri", default=DEFAULT_MONGO_URI, help="MongoDB URI including the database name.")
+    parser.add_argument("--users", type=int, default=100_000, help="Number of users to create.")
+    parser.add_argument("--offset", type=int, default=0, help="First user index, to append to an existing dataset.")
+    parser.add_argument("--mean-logins", type=float, default=10.0, help="Average number of logins per user.")
+    parser.add_argument("--max-logins", type=int, default=5_000, help="Upper bound on logins for a single user.")
+    parser.add_argument("--days", type=int, default=365, help="Spread login timestamps over this many past days.")
+    parser.add_argument("--ip-pool", type=int, default=50_000, help="Number of distinct IP addresses.")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Documents per insert_many call.")
+    parser.add_argument("--password", default="password123", help="Password shared by all password users.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible datasets.")
+    parser.add_argument("--drop", action="store_true", help="Drop the existing collections first.")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    asyncio.run(generate(parse_args()))
@@ -0,0 +1,125 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+from jose import jwt
+
+from app.tokens import ExpiredTokenError, TokenCodec, TokenError
+
+SECRET = "current-secret"
+
+def b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def forge(header: dict, claims: dict, secret: str = SECRET, algorithm=hashlib.sha256) -> str:
+    """Builds a token with an arbitrary header, signed with `secret`."""
+    signing_input = f"{b64(json.dumps(header).encode())}.{b64(json.dumps(claims).encode())}"
+    signature = hmac.new(secret.encode(), signing_input.encode(), algorithm).digest()
+    return f"{signing_input}.{b64(signature)}"
+
+def future(seconds: int = 60) -> int:
+    return int(time.time()) + seconds
+
+def test_round_trip():
+    codec = TokenCodec(SECRET, key_id="2025")
+    claims = {"sub": "user@example.com", "exp": future()}
+    assert codec.decode(codec.encode(claims)) == claims
+
+def test_codec_token_verifies_with_jose():
+    token = TokenCodec(SECRET, key_id="2025").encode({"sub": "user@example.com", "exp": future()})
+    assert jwt.decode(token, SECRET, algorithms=[TokenCodec.ALGORITHM])["sub"] == "user@example.com"
+    assert jwt.get_unverified_header(token)["kid"] == "2025"
+
+def test_jose_token_verifies_with_codec():
+    token = jwt.encode({"sub": "user@example.com", "exp": future()}, SECRET, algorithm=TokenCodec.ALGORITHM)
+    assert TokenCodec(SECRET).decode(token)["sub"] == "user@example.com"
+    assert TokenCodec(SECRET, key_id="2025").decode(token)["sub"] == "user@example.com"
+
+def test_expired_token():
+    codec = TokenCodec(SECRET)
+    with pytest.raises(ExpiredTokenError):
+        codec.decode(codec.encode({"sub": "user@example.com", "exp": future(-1)}))
+
+def test_not_yet_valid_token():
+    codec = TokenCodec(SECRET)
+    with pytest.raises(TokenError):
+        codec.decode(codec.encode({"sub": "user@example.com", "nbf": future()}))
+
+@pytest.mark.parametrize("header", [
+    {"alg": "none", "typ": "JWT"},
+    {"alg": "HS512", "typ": "JWT"},
+    {"typ": "JWT"},
+])
+def test_unsupported_algorithm(header):
+    with pytest.raises(TokenError):
+        TokenCodec(SECRET).decode(forge(header, {"sub": "user@example.com"}))
+
+def test_alg_none_without_signature():
+    header = b64(json.dumps({"alg": "none"}).encode())
+    payload = b64(json.dumps({"sub": "admin@example.com"}).encode())
+    token = f"{header}.{payload}."
+    with pytest.raises(TokenError):
+        TokenCodec(SECRET).decode(token)
+
+def test_hs512_signature_rejected():
+    token = forge({"alg": "HS512"}, {"sub": "user@example.com"}, algorithm=hashlib.sha512)
+    with pytest.raises(TokenError):
+        TokenCodec(SECRET).decode(token)
+
+@pytest.mark.parametrize("kid", ["unknown", 2025, None, ["2025"]])
+def test_unknown_or_invalid_kid(kid):
+    codec = TokenCodec(SECRET, key_id="2025")
+    with pytest.raises(TokenError):
+        codec.decode(forge({"alg": "HS256", "kid": kid}, {"sub": "user@example.com"}))
+
+def test_tampered_payload():
+    codec = TokenCodec(SECRET)
+    header, _, signature = codec.encode({"sub": "user@example.com"}).split(".")
+    payload = b64(json.dumps({"sub": "admin@example.com"}).encode())
+    with pytest.raises(TokenError):
+        codec.decode(f"{header}.{payload}.{signature}")
+
+def test_tampered_signature():
+    codec = TokenCodec(SECRET)
+    token = codec.encode({"sub": "user@example.com"})
+    tampered = token[:-1] + ("A" if token[-1] != "A" else "B")
+    with pytest.raises(TokenError):
+        codec.decode(tampered)
+
+def test_wrong_secret():
+    token = TokenCodec("other-secret").encode({"sub": "user@example.com"})
+    with pytest.raises(TokenError):
+        TokenCodec(SECRET).decode(token)
+
+def test_previous_key_still_verifies():
+    old_token = TokenCodec("old-secret", key_id="2024").encode({"sub": "user@example.com", "exp": future()})
+    codec = TokenCodec("new-secret", key_id="2025", previous_keys={"2024": "old-secret"})
+    assert codec.decode(old_token)["sub"] == "user@example.com"
+    # Dropping the previous key revokes its tokens.
+    with pytest.raises(TokenError):
+        TokenCodec("new-secret", key_id="2025").decode(old_token)
+
+def test_legacy_key_verifies_tokens_without_kid():
+    legacy_token = TokenCodec("old-secret").encode({"sub": "user@example.com", "exp": future()})
+    codec = TokenCodec("new-secret", key_id="2025", legacy_key="old-secret")
+    assert codec.decode(legacy_token)["sub"] == "user@example.com"
+    # New tokens are still signed and verified with the current secret.
+    assert codec.decode(codec.encode({"sub": "new@example.com"}))["sub"] == "new@example.com"
+
+def test_tokens_without_kid_use_current_secret_by_default():
+    legacy_token = TokenCodec(SECRET).encode({"sub": "user@example.com"})
+    assert TokenCodec(SECRET, key_id="2025").decode(legacy_token)["sub"] == "user@example.com"
+    with pytest.raises(TokenError):
+        TokenCodec("new-secret", key_id="2025", previous_keys={"2024": SECRET}).decode(legacy_token)
+
+def test_legacy_key_requires_key_id():
+    with pytest.raises(ValueError):
+        TokenCodec("new-secret", legacy_key="old-secret")
+
+@pytest.mark.parametrize("token", [None, 123, b"a.b.c", "", "a.b", "a.b.c.d", "not-a-token", "a.b.é"])
+def test_malformed_input(token):
+    with pytest.raises(TokenError):
+        TokenCodec(SECRET).decode(token)